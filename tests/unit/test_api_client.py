@@ -0,0 +1,83 @@
+"""
+Unit tests for the UI API client cache.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("requests")
+
+from ui import api_client
+from ui.api_client import get_api_client
+
+
+class TestGetAPIClient:
+    """Tests for get_api_client caching and eviction."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, monkeypatch):
+        """Isolate the module-level client cache and record closed clients."""
+        monkeypatch.setattr(api_client, "_api_clients", {})
+        monkeypatch.setattr(api_client, "_api_client", None)
+        monkeypatch.setattr(api_client, "_retired_clients", [])
+        closed = []
+        monkeypatch.setattr(api_client.OCRAPIClient, "close", lambda self: closed.append(self))
+        return closed
+
+    @pytest.mark.unit
+    def test_same_key_reuses_client(self):
+        """Test repeated calls with the same URL and key share one client."""
+        first = get_api_client(base_url="http://a:8000", api_key="k")
+        second = get_api_client(base_url="http://a:8000", api_key="k")
+
+        assert first is second
+
+    @pytest.mark.unit
+    def test_different_key_gets_new_client(self):
+        """Test a different API key gets its own client."""
+        first = get_api_client(base_url="http://a:8000", api_key="k1")
+        second = get_api_client(base_url="http://a:8000", api_key="k2")
+
+        assert first is not second
+        assert second.api_key == "k2"
+
+    @pytest.mark.unit
+    def test_no_arguments_returns_last_used(self):
+        """Test a call without arguments returns the last used client."""
+        client = get_api_client(base_url="http://a:8000")
+
+        assert get_api_client() is client
+
+    @pytest.mark.unit
+    def test_oldest_client_evicted_and_closed(self, fresh_cache):
+        """Test the cache is bounded and evicted clients are closed."""
+        limit = api_client._MAX_CACHED_CLIENTS
+        clients = [get_api_client(base_url=f"http://host{i}:8000") for i in range(limit + 1)]
+
+        assert len(api_client._api_clients) == limit
+        assert ("http://host0:8000", None) not in api_client._api_clients
+        assert fresh_cache == [clients[0]]
+
+    @pytest.mark.unit
+    def test_global_client_not_closed_on_eviction(self, monkeypatch, fresh_cache):
+        """Test evicting the current global client defers closing it to exit."""
+        monkeypatch.setattr(api_client, "_MAX_CACHED_CLIENTS", 1)
+        first = get_api_client(base_url="http://a:8000")
+        get_api_client(base_url="http://b:8000")
+
+        assert fresh_cache == []
+        assert api_client._retired_clients == [first]
+
+        api_client._close_api_clients()
+
+        assert first in fresh_cache
+
+    @pytest.mark.unit
+    def test_concurrent_access(self):
+        """Test concurrent calls for overlapping keys don't race."""
+        urls = [f"http://host{i % 12}:8000" for i in range(200)]
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            clients = list(pool.map(lambda url: get_api_client(base_url=url), urls))
+
+        assert all(client.base_url == url for client, url in zip(clients, urls))
+        assert len(api_client._api_clients) <= api_client._MAX_CACHED_CLIENTS
@@ -0,0 +1,189 @@
+"""
+Unit tests for the API UI output builders.
+"""
+import csv
+import io
+import threading
+import xml.etree.ElementTree as ET
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("gradio")
+
+from ui import app_api
+from ui.app_api import (
+    _RE_EQUATION, _cached_health_check, _line_items_csv, _structured_xml,
+    process_documents_batch,
+)
+
+
+class TestLineItemsCSV:
+    """Tests for the line item CSV builder."""
+
+    @pytest.mark.unit
+    def test_header_and_rows(self):
+        """Test header row followed by one row per item."""
+        output = _line_items_csv([
+            {"description": "Widget", "quantity": 2, "unit_price": "$5", "total": "$10"},
+        ])
+
+        assert output == "Description,Quantity,Unit Price,Total\nWidget,2,$5,$10\n"
+
+    @pytest.mark.unit
+    def test_special_characters_round_trip(self):
+        """Test descriptions with commas, quotes and newlines stay in one cell."""
+        descriptions = ['Bolts, steel', 'Cable 6" long', 'Line one\nline two']
+        items = [{"description": d, "quantity": 1, "unit_price": "1", "total": "1"}
+                 for d in descriptions]
+
+        rows = list(csv.reader(io.StringIO(_line_items_csv(items))))
+
+        assert len(rows) == 4
+        assert [row[0] for row in rows[1:]] == descriptions
+        assert all(len(row) == 4 for row in rows)
+
+    @pytest.mark.unit
+    def test_missing_keys(self):
+        """Test missing item keys produce empty cells."""
+        rows = list(csv.reader(io.StringIO(_line_items_csv([{"description": "Only"}]))))
+
+        assert rows[1] == ["Only", "", "", ""]
+
+
+class TestStructuredXML:
+    """Tests for the simplified XML builder."""
+
+    @pytest.mark.unit
+    def test_escapes_field_names_and_values(self):
+        """Test <, & and \" in field names and values produce well-formed XML."""
+        fields = {
+            'Terms & "Conditions"': "Net 30 <days>",
+            "Vendor": 'Smith & Sons "Ltd"',
+        }
+
+        root = ET.fromstring(_structured_xml({}, {}, fields))
+        parsed = {f.get("name"): f.text for f in root.iter("field")}
+
+        assert parsed == fields
+
+    @pytest.mark.unit
+    def test_escapes_metadata(self):
+        """Test document metadata is escaped too."""
+        doc_info = {"filename": "a&b <1>.pdf", "file_type": "pdf", "total_pages": 2}
+        result = {"document_type": "invoice", "language": "en", "confidence": 0.9}
+
+        root = ET.fromstring(_structured_xml(doc_info, result, {}))
+
+        assert root.findtext("metadata/filename") == "a&b <1>.pdf"
+        assert root.findtext("metadata/total_pages") == "2"
+        assert root.findtext("document_type") == "invoice"
+
+
+class TestDetectionPatterns:
+    """Tests for the bounding box detection regexes."""
+
+    @pytest.mark.unit
+    def test_long_display_equation_detected(self):
+        """Test equations longer than a few hundred characters still match."""
+        assert _RE_EQUATION.search("$$" + "x" * 600 + "$$")
+        assert _RE_EQUATION.search("cost is $" + "y" * 600 + "$ here")
+
+
+class _FakeClient:
+    """Stand-in for OCRAPIClient that counts health checks."""
+
+    def __init__(self, base_url="http://a:8000", api_key=None, success=True):
+        self.base_url = base_url
+        self.api_key = api_key
+        self.success = success
+        self.calls = 0
+
+    def health_check(self):
+        self.calls += 1
+        return SimpleNamespace(success=self.success)
+
+
+class TestCachedHealthCheck:
+    """Tests for the health check cache."""
+
+    @pytest.fixture(autouse=True)
+    def clock(self, monkeypatch):
+        """Isolate the cache and drive time.monotonic from the test."""
+        monkeypatch.setattr(app_api, "_HEALTH_CACHE", {})
+        now = [1000.0]
+        monkeypatch.setattr(app_api.time, "monotonic", lambda: now[0])
+        return now
+
+    @pytest.mark.unit
+    def test_success_cached_within_ttl(self, clock):
+        """Test a successful check is reused until the TTL expires."""
+        client = _FakeClient()
+
+        first = _cached_health_check(client, ttl=30)
+        clock[0] += 29
+        second = _cached_health_check(client, ttl=30)
+
+        assert second is first
+        assert client.calls == 1
+
+        clock[0] += 1
+        _cached_health_check(client, ttl=30)
+
+        assert client.calls == 2
+
+    @pytest.mark.unit
+    def test_failure_not_cached(self):
+        """Test a failed check is retried on the next call."""
+        client = _FakeClient(success=False)
+
+        _cached_health_check(client)
+        _cached_health_check(client)
+
+        assert client.calls == 2
+
+    @pytest.mark.unit
+    def test_clients_do_not_share_entries(self):
+        """Test clients with a different URL or API key are checked separately."""
+        clients = [
+            _FakeClient("http://a:8000", "k1"),
+            _FakeClient("http://a:8000", "k2"),
+            _FakeClient("http://b:8000", "k1"),
+        ]
+
+        for client in clients:
+            _cached_health_check(client)
+
+        assert [client.calls for client in clients] == [1, 1, 1]
+
+
+class TestProcessDocumentsBatch:
+    """Tests for the batched Gradio handler."""
+
+    @pytest.mark.unit
+    def test_one_call_per_submission_in_order(self, monkeypatch):
+        """Test N submissions make N calls and outputs keep submission order."""
+        calls = []
+        lock = threading.Lock()
+
+        def fake_process(file, tokens):
+            with lock:
+                calls.append((file, tokens))
+            return f"text-{file}", f"json-{file}"
+
+        monkeypatch.setattr(app_api, "process_document_via_api", fake_process)
+
+        files = ["a", "b", "c"]
+        texts, jsons = process_documents_batch(files, [100, 200, 300])
+
+        assert sorted(calls) == [("a", 100), ("b", 200), ("c", 300)]
+        assert texts == ["text-a", "text-b", "text-c"]
+        assert jsons == ["json-a", "json-b", "json-c"]
+
+    @pytest.mark.unit
+    def test_single_submission(self, monkeypatch):
+        """Test a batch of one still returns one list per output."""
+        monkeypatch.setattr(app_api, "process_document_via_api",
+                            lambda file: (f"text-{file}", f"json-{file}"))
+
+        assert process_documents_batch(["a"]) == (["text-a"], ["json-a"])
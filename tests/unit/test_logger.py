@@ -0,0 +1,201 @@
+"""
+Unit tests for structured logging through the queue listener.
+"""
+import inspect
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import time
+
+import pytest
+
+from utils import logger as log_module
+from utils.logger import (
+    JSONFormatter, StructuredLogger, clear_request_context, set_request_context,
+)
+
+
+def _read_lines(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestQueueFileRoundTrip:
+    """Tests for records passing through the queue handler to the log file."""
+
+    @pytest.fixture
+    def pipeline(self, tmp_path, monkeypatch):
+        """A StructuredLogger feeding a private queue, listener and log file.
+
+        The test's listener stands in for the module one, so
+        _stop_listener() drains and flushes it as it would at exit.
+        """
+        log_queue = queue.SimpleQueue()
+        path = tmp_path / "app.log"
+        file_handler = log_module._BatchingFileHandler(str(path), log_queue)
+        file_handler.setFormatter(log_module._SHARED_FORMATTER)
+        listener = logging.handlers.QueueListener(log_queue, file_handler)
+        listener.start()
+        monkeypatch.setattr(log_module, "_listener", listener)
+        monkeypatch.setattr(log_module, "_FILE_HANDLERS", {str(path): file_handler})
+
+        structured = StructuredLogger("nanonets.test_roundtrip", logging.INFO)
+        monkeypatch.setattr(structured.logger, "handlers",
+                            [log_module._DeferredQueueHandler(log_queue)])
+
+        yield structured, path
+        log_module._stop_listener()
+        file_handler.close()
+        clear_request_context()
+
+    @pytest.mark.unit
+    def test_fields_and_call_site(self, pipeline):
+        """Test message, extra fields, context and caller location reach the file."""
+        structured, path = pipeline
+        set_request_context(request_id="req_1", tenant_id="tenant_1")
+
+        line = inspect.currentframe().f_lineno + 1
+        structured.info("document_processed", pages=3, status="ok")
+        log_module._stop_listener()
+
+        [entry] = _read_lines(path)
+        assert entry["message"] == "document_processed"
+        assert entry["level"] == "INFO"
+        assert entry["logger"] == "nanonets.test_roundtrip"
+        assert entry["pages"] == 3
+        assert entry["status"] == "ok"
+        assert entry["request_id"] == "req_1"
+        assert entry["tenant_id"] == "tenant_1"
+        assert entry["module"] == "test_logger"
+        assert entry["function"] == "test_fields_and_call_site"
+        assert entry["line"] == line
+
+    @pytest.mark.unit
+    def test_disabled_level_not_written(self, pipeline):
+        """Test records below the logger level are dropped."""
+        structured, path = pipeline
+
+        structured.debug("hidden")
+        structured.info("shown")
+        log_module._stop_listener()
+
+        assert [e["message"] for e in _read_lines(path)] == ["shown"]
+
+    @pytest.mark.unit
+    def test_exception_includes_traceback(self, pipeline):
+        """Test exception() records the traceback and extra fields."""
+        structured, path = pipeline
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            line = inspect.currentframe().f_lineno + 1
+            structured.exception("failed", document_id="doc_1")
+        log_module._stop_listener()
+
+        [entry] = _read_lines(path)
+        assert entry["level"] == "ERROR"
+        assert entry["document_id"] == "doc_1"
+        assert "ValueError: boom" in entry["exception"]
+        assert entry["module"] == "test_logger"
+        assert entry["function"] == "test_exception_includes_traceback"
+        assert entry["line"] == line
+
+
+class TestFork:
+    """Tests for logging from a forked child process."""
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_child_records_are_written(self, tmp_path):
+        """Test a child forked after the listener started gets its own listener."""
+        structured = StructuredLogger("nanonets.test_fork", logging.INFO)
+        assert log_module._listener is not None
+        path = tmp_path / "child.log"
+
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                with open(path, "w") as f:
+                    log_module._SHARED_STDOUT.setStream(f)
+                    structured.info("from_child")
+                    log_module._stop_listener()
+                code = 0
+            finally:
+                os._exit(code)
+
+        _, status = os.waitpid(pid, 0)
+
+        assert os.WEXITSTATUS(status) == 0
+        assert [e["message"] for e in _read_lines(path)] == ["from_child"]
+
+
+class TestBatchingFileHandler:
+    """Tests for write coalescing in the log file handler."""
+
+    @staticmethod
+    def _record(level, message):
+        return logging.LogRecord("test", level, __file__, 0, message, None, None)
+
+    @pytest.fixture
+    def handler(self, tmp_path):
+        log_queue = queue.SimpleQueue()
+        handler = log_module._BatchingFileHandler(str(tmp_path / "app.log"), log_queue)
+        handler.setFormatter(JSONFormatter())
+        yield handler, log_queue, tmp_path / "app.log"
+        handler.close()
+
+    @pytest.mark.unit
+    def test_buffers_while_queue_has_backlog(self, handler):
+        """Test records are held back until the queue drains."""
+        file_handler, log_queue, path = handler
+        log_queue.put(object())
+
+        file_handler.handle(self._record(logging.INFO, "first"))
+        assert path.read_text() == ""
+
+        log_queue.get()
+        file_handler.handle(self._record(logging.INFO, "second"))
+        assert [e["message"] for e in _read_lines(path)] == ["first", "second"]
+
+    @pytest.mark.unit
+    def test_error_flushes_immediately(self, handler):
+        """Test ERROR records are flushed even with a backlog."""
+        file_handler, log_queue, path = handler
+        log_queue.put(object())
+
+        file_handler.handle(self._record(logging.ERROR, "failure"))
+
+        assert [e["message"] for e in _read_lines(path)] == ["failure"]
+
+    @pytest.mark.unit
+    def test_close_flushes_buffer(self, handler):
+        """Test buffered records are written when the handler is closed at exit."""
+        file_handler, log_queue, path = handler
+        log_queue.put(object())
+
+        file_handler.handle(self._record(logging.INFO, "pending"))
+        file_handler.close()
+
+        assert [e["message"] for e in _read_lines(path)] == ["pending"]
+
+
+class TestJSONFormatterTimestamp:
+    """Tests for the record timestamp."""
+
+    @pytest.mark.unit
+    def test_timestamp_from_record_creation(self):
+        """Test the timestamp reflects record creation, not formatting time."""
+        record = logging.LogRecord("test", logging.INFO, __file__, 0, "msg", None, None)
+        record.created = 0.0
+        formatter = JSONFormatter()
+
+        first = json.loads(formatter.format(record))
+        time.sleep(0.01)
+        second = json.loads(formatter.format(record))
+
+        assert first["timestamp"] == "1970-01-01T00:00:00Z"
+        assert second["timestamp"] == first["timestamp"]
@@ -0,0 +1,36 @@
+"""
+Unit tests for the shared JSON serialization helpers.
+"""
+import json
+
+import pytest
+
+from utils import serialization
+from utils.serialization import dumps, dumps_bytes
+
+PAYLOAD = {"vendor": "Café Ünïcode", "total": 12.5, "items": [1, 2], "paid": True, "note": None}
+
+
+class TestSerialization:
+    """Tests for dumps and dumps_bytes."""
+
+    @pytest.mark.unit
+    def test_dumps_round_trips(self):
+        """Test indented output parses back to the same object."""
+        assert json.loads(dumps(PAYLOAD)) == PAYLOAD
+
+    @pytest.mark.unit
+    def test_fallback_bytes_are_compact_and_unescaped(self, monkeypatch):
+        """Test the json fallback matches orjson's compact, non-ASCII-escaping output."""
+        monkeypatch.setattr(serialization, "HAS_ORJSON", False)
+
+        assert dumps_bytes({"a": "é", "b": [1, 2]}) == '{"a":"é","b":[1,2]}'.encode()
+
+    @pytest.mark.unit
+    def test_bytes_identical_with_and_without_orjson(self, monkeypatch):
+        """Test signatures don't depend on whether orjson is installed."""
+        pytest.importorskip("orjson")
+        with_orjson = dumps_bytes(PAYLOAD)
+        monkeypatch.setattr(serialization, "HAS_ORJSON", False)
+
+        assert dumps_bytes(PAYLOAD) == with_orjson
@@ -0,0 +1,90 @@
+"""
+Unit tests for startup directory handling.
+"""
+import os
+
+import pytest
+
+from utils.startup import StartupValidator, initialize_directories, _DIRS
+
+DIR_NAMES = [name for name, _ in _DIRS]
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run in an empty working directory."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestValidateDirectories:
+    """Tests for the read-only directory check."""
+
+    @pytest.mark.unit
+    def test_missing_directories_warn_without_creating(self, workdir):
+        """Test validation only warns and never creates directories."""
+        validator = StartupValidator()
+        validator._validate_directories()
+
+        assert len(validator.warnings) == len(DIR_NAMES)
+        assert all("--init" in warning for warning in validator.warnings)
+        assert not any(os.path.exists(name) for name in DIR_NAMES)
+
+    @pytest.mark.unit
+    def test_existing_directories_pass(self, workdir):
+        """Test no warnings once the directories exist."""
+        for name in DIR_NAMES:
+            os.mkdir(name)
+
+        validator = StartupValidator()
+        validator._validate_directories()
+
+        assert validator.warnings == []
+
+    @pytest.mark.unit
+    def test_regular_file_is_not_a_directory(self, workdir):
+        """Test a regular file in place of a directory is reported."""
+        for name in DIR_NAMES:
+            os.mkdir(name)
+        os.rmdir(DIR_NAMES[0])
+        (workdir / DIR_NAMES[0]).write_text("")
+
+        validator = StartupValidator()
+        validator._validate_directories()
+
+        assert len(validator.warnings) == 1
+        assert DIR_NAMES[0] in validator.warnings[0]
+
+
+class TestInitializeDirectories:
+    """Tests for the one-shot directory creation step."""
+
+    @pytest.mark.unit
+    def test_creates_directories(self, workdir):
+        """Test all directories are created."""
+        assert initialize_directories()
+        assert all(os.path.isdir(name) for name in DIR_NAMES)
+
+    @pytest.mark.unit
+    def test_idempotent(self, workdir):
+        """Test running twice succeeds."""
+        assert initialize_directories()
+        assert initialize_directories()
+
+    @pytest.mark.unit
+    def test_regular_file_fails(self, workdir):
+        """Test a regular file in place of a directory is a failure."""
+        (workdir / DIR_NAMES[0]).write_text("")
+
+        assert not initialize_directories()
+        assert all(os.path.isdir(name) for name in DIR_NAMES[1:])
+
+    @pytest.mark.unit
+    def test_os_error_fails_without_raising(self, workdir, monkeypatch):
+        """Test an OSError (e.g. permission denied) is reported, not raised."""
+        def deny(path):
+            raise PermissionError(13, "Permission denied", path)
+
+        monkeypatch.setattr(os, "makedirs", deny)
+
+        assert not initialize_directories()
@@ -1,9 +1,13 @@
 """
 API Client for communicating with the FastAPI OCR backend.
 """
+import atexit
 import os
+import threading
 import requests
-from typing import Optional, Dict, Any, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 
 
@@ -23,7 +27,8 @@ class OCRAPIClient:
         self,
         base_url: str = None,
         api_key: str = None,
-        timeout: int = 300
+        timeout: int = 300,
+        connect_timeout: float = 5.0
     ):
         """
         Initialize the API client.
@@ -32,11 +37,28 @@ class OCRAPIClient:
             base_url: Base URL of the API server (default: http://localhost:8000)
             api_key: Optional API key for authentication
             timeout: Request timeout in seconds (default: 300 for large documents)
+            connect_timeout: Connection timeout in seconds (default: 5)
         """
         self.base_url = base_url or os.getenv("API_BASE_URL", "http://localhost:8000")
         self.api_key = api_key or os.getenv("API_KEY", "")
         self.timeout = timeout
+        self.connect_timeout = connect_timeout
         self.api_prefix = "/api/v1"
+
+        # Pooled keep-alive session shared by all calls from this client;
+        # only connection failures are retried so uploads are never re-sent
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.3)
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        self.session.close()
     
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers with authentication."""
@@ -57,14 +79,14 @@ class OCRAPIClient:
         url = f"{self.base_url}{self.api_prefix}{endpoint}"
         
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
                 headers=self._get_headers(),
                 files=files,
                 data=data,
                 params=params,
-                timeout=self.timeout
+                timeout=(self.connect_timeout, self.timeout)
             )
             
             if response.status_code == 200:
@@ -110,7 +132,9 @@ class OCRAPIClient:
         # Note: /status is at root level, not under api_prefix
         url = f"{self.base_url}/status"
         try:
-            response = requests.get(url, headers=self._get_headers(), timeout=self.timeout)
+            response = self.session.get(
+                url, headers=self._get_headers(), timeout=(self.connect_timeout, self.timeout)
+            )
             if response.status_code == 200:
                 return APIResponse(success=True, data=response.json(), status_code=200)
             else:
@@ -288,11 +312,23 @@ class OCRAPIClient:
 # Global client instance
 _api_client: Optional[OCRAPIClient] = None
 
+# Clients keyed by (base_url, api_key) so their sessions are reused
+_api_clients: Dict[Tuple[str, Optional[str]], OCRAPIClient] = {}
+_MAX_CACHED_CLIENTS = 8
+_api_clients_lock = threading.Lock()
+
+# Evicted clients that were still the global client (possibly in use by
+# another thread); closed at exit instead of on eviction
+_retired_clients: List[OCRAPIClient] = []
+
 
 def get_api_client(base_url: str = None, api_key: str = None) -> OCRAPIClient:
     """
     Get or create the global API client instance.
     
+    Clients are cached per (base_url, api_key) so repeated calls share one
+    pooled HTTP session instead of opening new connections.
+    
     Args:
         base_url: Base URL of the API server
         api_key: Optional API key
@@ -302,10 +338,39 @@ def get_api_client(base_url: str = None, api_key: str = None) -> OCRAPIClient:
     """
     global _api_client
     
-    if _api_client is None or base_url is not None:
-        _api_client = OCRAPIClient(base_url=base_url, api_key=api_key)
-    
-    return _api_client
+    with _api_clients_lock:
+        if base_url is not None:
+            key = (base_url, api_key)
+            client = _api_clients.get(key)
+            if client is None:
+                if len(_api_clients) >= _MAX_CACHED_CLIENTS:
+                    # Evict the oldest entry
+                    evicted = _api_clients.pop(next(iter(_api_clients)))
+                    if evicted is _api_client:
+                        _retired_clients.append(evicted)
+                    else:
+                        evicted.close()
+                client = OCRAPIClient(base_url=base_url, api_key=api_key)
+                _api_clients[key] = client
+            _api_client = client
+        elif _api_client is None:
+            _api_client = OCRAPIClient(api_key=api_key)
+
+        return _api_client
+
+
+def _close_api_clients():
+    """Close the pooled sessions of all cached and retired clients."""
+    with _api_clients_lock:
+        for client in list(_api_clients.values()) + _retired_clients:
+            client.close()
+        _api_clients.clear()
+        _retired_clients.clear()
+        if _api_client is not None:
+            _api_client.close()
+
+
+atexit.register(_close_api_clients)
 
 
 if __name__ == "__main__":
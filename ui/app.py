@@ -2,26 +2,111 @@
 Gradio web interface for document OCR processing.
 """
 import gradio as gr
-import json
 import uuid
 import time
 import hashlib
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
 from PIL import Image, ImageDraw, ImageFont
 
 from config import settings, PREDEFINED_FIELDS
-from core.ocr_engine import get_ocr_engine
-from core.output_parser import OutputParser
-from core.field_extractor import FieldExtractor
-from core.format_converter import FormatConverter
-from core.structured_output import get_structured_processor
-from core.document_classifier import get_document_classifier
-from core.language_support import get_language_detector
-
-
-def create_bounding_box_visualization(image: Image.Image, ocr_text: str) -> Image.Image:
-    """Create visualization with bounding boxes for detected elements."""
-    img_with_boxes = image.copy()
+from utils.serialization import dumps, dumps_bytes
+
+# Upper bound on OCR text rendered in the HTML preview / scanned for bbox hints
+_MAX_PREVIEW_CHARS = 100_000
+
+# Longest side (px) of the bounding box visualization
+_MAX_BBOX_SIZE = 1024
+
+# Detection patterns for the bounding box visualization
+_RE_TABLE = re.compile(r'<table', re.IGNORECASE)
+_RE_EQUATION = re.compile(r'\$\$[^$]+\$\$|\$[^$]+\$')
+_RE_IMAGE = re.compile(r'<img>.*?</img>')
+
+
+# Post-processing helpers shared across requests, see _init_singletons()
+_PARSER = None
+_CONVERTER = None
+_EXTRACTOR = None
+_STRUCTURED = None
+_SINGLETONS_LOCK = threading.Lock()
+
+
+def _init_singletons():
+    """Create the shared post-processing helpers once per process.
+
+    The core modules are imported here rather than at module load so that
+    importing ui.app does not pull in the ML stack.
+    """
+    global _PARSER, _CONVERTER, _EXTRACTOR, _STRUCTURED
+    # _STRUCTURED is published last, so once it is set all four are
+    if _STRUCTURED is not None:
+        return
+    with _SINGLETONS_LOCK:
+        if _STRUCTURED is not None:
+            return
+        from core.output_parser import OutputParser
+        from core.field_extractor import FieldExtractor
+        from core.format_converter import FormatConverter
+        from core.structured_output import get_structured_processor
+
+        parser = OutputParser()
+        converter = FormatConverter()
+        extractor = FieldExtractor()
+        structured = get_structured_processor()
+
+        _PARSER, _CONVERTER, _EXTRACTOR = parser, converter, extractor
+        _STRUCTURED = structured
+
+
+def _field_confidence(field: str) -> float:
+    """Placeholder confidence score derived from the field name.
+
+    Uses 32-bit FNV-1a rather than hash(), whose str hashing is salted per
+    process, so a field gets the same score across restarts. It is slower
+    than hash(); predefined fields are precomputed in _PREDEFINED_CONF.
+    """
+    h = 2166136261
+    for b in field.encode():
+        h = ((h ^ b) * 16777619) & 0xFFFFFFFF
+    return round(0.85 + (h % 15) / 100, 2)
+
+
+# Scores for the predefined fields never change within a process
+_PREDEFINED_CONF = {field: _field_confidence(field) for field in PREDEFINED_FIELDS}
+
+
+
+
+def create_bounding_box_visualization(image: Image.Image, ocr_text: str,
+                                      inplace: bool = False) -> Optional[Image.Image]:
+    """Create visualization with bounding boxes for detected elements.
+
+    Returns None when nothing is detected. With ``inplace=True`` the boxes
+    may be drawn directly onto ``image``; only pass it when the caller does
+    not reuse the source pixels.
+    """
+    # Probe the text first so plain pages skip the resize/copy/draw path
+    has_table = _RE_TABLE.search(ocr_text) is not None
+    has_equation = _RE_EQUATION.search(ocr_text) is not None
+    has_image = _RE_IMAGE.search(ocr_text) is not None
+    if not (has_table or has_equation or has_image):
+        return None
+
+    # Indicators are coarse and laid out relative to the image size, so
+    # drawing on a downscaled copy looks the same at a fraction of the cost
+    scale = min(1.0, _MAX_BBOX_SIZE / max(image.size))
+    if scale < 1.0:
+        image = image.resize(
+            (int(image.width * scale), int(image.height * scale)), Image.BILINEAR
+        )
+
+    # A resized image is already a private buffer
+    img_with_boxes = image if inplace or scale < 1.0 else image.copy()
     draw = ImageDraw.Draw(img_with_boxes)
 
     try:
@@ -39,23 +124,18 @@ def create_bounding_box_visualization(image: Image.Image, ocr_text: str) -> Imag
     width, height = img_with_boxes.size
 
     # Draw indicators for detected elements
-    import re
-    from bs4 import BeautifulSoup
-
-    soup = BeautifulSoup(ocr_text, 'html.parser')
-
-    if soup.find_all('table'):
+    if has_table:
         draw.rectangle([(10, 10), (width - 10, height // 3)],
                        outline=colors['table'], width=3)
         draw.text((15, 15), "Table Detected", fill=colors['table'], font=font)
 
-    if re.search(r'\$\$[^$]+\$\$|\$[^$]+\$', ocr_text):
+    if has_equation:
         draw.rectangle([(10, height // 3), (width - 10, 2 * height // 3)],
                        outline=colors['equation'], width=3)
         draw.text((15, height // 3 + 5), "Equation Detected",
                   fill=colors['equation'], font=font)
 
-    if re.search(r'<img>.*?</img>', ocr_text):
+    if has_image:
         draw.rectangle([(10, 2 * height // 3), (width - 10, height - 10)],
                        outline=colors['image'], width=3)
         draw.text((15, 2 * height // 3 + 5), "Image Detected",
@@ -64,11 +144,54 @@ def create_bounding_box_visualization(image: Image.Image, ocr_text: str) -> Imag
     return img_with_boxes
 
 
+# Serializes model calls when the Gradio queue runs handlers concurrently;
+# post-processing of one request overlaps with OCR of the next
+_MODEL_LOCK = threading.Lock()
+
+# Placeholder values for every output after (text, processing_time) on error
+_EMPTY_OUTPUTS = ("", "", "", "", "", "", "", "", "", None, "", "", "", "")
+
+# Statistics tab layout, filled per request with str.format_map()
+_STATS_TEMPLATE = """
+Processing Statistics:
+
+Document Information:
+- Filename: {filename}
+- File Size: {file_size_mb} MB
+- File Type: {file_type}
+- Total Pages: {total_pages}
+
+Document Classification:
+- Document Type: {document_type}
+- Classification Confidence: {confidence}
+- Language: {language}
+
+Processing Metrics:
+- Total Processing Time: {processing_time}
+- API Response Time: {total_ms} ms
+
+Extraction Results:
+- Total Fields: {total_fields}
+- Fields Found: {fields_found}
+- Fields Empty: {fields_empty}
+- Success Rate: {success_rate}%
+- Entities Extracted: {entities}
+- Line Items Found: {line_items}
+
+Content Detection:
+- Tables Found: {tables}
+- Equations Found: {equations}
+- Images Found: {images}
+- Watermarks Found: {watermarks}
+"""
+
+
 def generate_api_request(api_endpoint, api_key, method, extracted_data,
-                         webhook_url, confidence_threshold, output_format):
+                         webhook_url, confidence_threshold, output_format,
+                         request_id=None, timestamp=None):
     """Generate a realistic API request structure."""
-    request_id = str(uuid.uuid4())
-    timestamp = datetime.now().isoformat()
+    request_id = request_id or str(uuid.uuid4())
+    timestamp = timestamp or datetime.now().isoformat()
 
     api_request = {
         "request": {
@@ -96,8 +219,8 @@ def generate_api_request(api_endpoint, api_key, method, extracted_data,
                     "total_fields": len(extracted_data),
                     "filled_fields": sum(1 for v in extracted_data.values() if v),
                     "confidence_scores": {
-                        field: round(0.85 + (hash(field) % 15) / 100, 2)
-                        for field in extracted_data.keys()
+                        field: _PREDEFINED_CONF.get(field) or _field_confidence(field)
+                        for field in extracted_data
                     }
                 }
             }
@@ -108,11 +231,7 @@ def generate_api_request(api_endpoint, api_key, method, extracted_data,
 
 
 def process_document_for_ui(file, max_new_tokens, max_image_size,
-                            enabled_fields,
-                            custom_field_1, custom_field_2, custom_field_3,
-                            custom_field_4, custom_field_5, custom_field_6,
-                            custom_field_7, custom_field_8, custom_field_9,
-                            custom_field_10,
+                            enabled_fields, custom_fields_rows,
                             api_endpoint, api_key, api_method, webhook_url,
                             confidence_threshold, output_format, enable_batch):
     """Orchestrate OCR and post-processing for Gradio output."""
@@ -120,113 +239,130 @@ def process_document_for_ui(file, max_new_tokens, max_image_size,
     process_start = time.time()
 
     if file is None:
-        return ("Error: No file provided.", "0:00:00", "", "", "", "", "",
-                "", "", "", "", None, "", "", "", "")
+        return ("Error: No file provided.", "0:00:00") + _EMPTY_OUTPUTS
 
     try:
+        now_iso = datetime.now().isoformat()
+        req_id = str(uuid.uuid4())
+        evt_id = str(uuid.uuid4())
+
         # Get OCR engine and process
+        from core.ocr_engine import get_ocr_engine
         engine = get_ocr_engine()
-        result = engine.process_document(
-            file.name,
-            max_tokens=max_new_tokens
-        )
+        with _MODEL_LOCK:
+            result = engine.process_document(
+                file.name,
+                max_tokens=max_new_tokens
+            )
 
         if not result.pages or not result.pages[0].success:
             error_msg = result.pages[0].error_message if result.pages else "Unknown error"
-            return (f"Error: {error_msg}", "0:00:00", "", "", "", "", "",
-                    "", "", "", "", None, "", "", "", "")
+            return (f"Error: {error_msg}", "0:00:00") + _EMPTY_OUTPUTS
 
         # Parse structured data
-        parser = OutputParser()
+        _init_singletons()
+        parser = _PARSER
         parsed = parser.parse(result.total_text)
-        converter = FormatConverter()
+        converter = _CONVERTER
 
         # Generate outputs
         ocr_text = result.total_text
         processing_time = result.total_processing_time
 
-        # HTML preview
-        ocr_html = ocr_text.replace('\n', '<br>')
-        full_html = f"""
-        <div style="font-family: Arial, sans-serif; padding: 20px; background: #f5f5f5; border-radius: 8px;">
-            <h2 style="color: #333; border-bottom: 2px solid #4CAF50; padding-bottom: 10px;">Document Preview</h2>
-            <div style="background: white; padding: 15px; border-radius: 5px; margin-top: 15px; line-height: 1.6;">
-                {ocr_html}
-            </div>
-        </div>
-        """
-
-        # Tables
-        html_tables = converter.get_all_tables_html(parsed)
-        csv_tables = []
-        for page in parsed.pages:
-            csv_tables.extend(page.tables_csv)
-        csv_output = "\n\n".join(csv_tables) if csv_tables else "No tables found."
-
-        # Equations
-        equations_output = converter.get_all_equations(parsed)
-
-        # Images, watermarks, page numbers
-        images_output = []
-        watermarks_output = []
-        page_numbers_output = []
-
-        for page in parsed.pages:
-            for i, desc in enumerate(page.image_descriptions):
-                images_output.append(f"Page {page.page_number}, Image {i + 1}: {desc}")
-            for i, wm in enumerate(page.watermarks):
-                watermarks_output.append(f"Page {page.page_number}, Watermark {i + 1}: {wm}")
-            for i, pn in enumerate(page.page_numbers_extracted):
-                page_numbers_output.append(f"Page {page.page_number}: {pn}")
-
-        images_str = "\n".join(images_output) if images_output else "No image descriptions found."
-        watermarks_str = "\n".join(watermarks_output) if watermarks_output else "No watermarks found."
-        page_nums_str = "\n".join(page_numbers_output) if page_numbers_output else "No page numbers found."
-
-        # JSON output using structured processor
         tables_html_list = []
         for page in parsed.pages:
             tables_html_list.extend(page.tables_html)
 
-        structured_processor = get_structured_processor()
-        structured_result = structured_processor.process(result.total_text, tables_html_list)
-        json_output = json.dumps(structured_result, indent=2)
+        # One row per custom field from the single-column Dataframe
+        custom_fields = [row[0].strip() for row in custom_fields_rows or []
+                         if row and row[0] and row[0].strip()]
+        extractor = _EXTRACTOR
+
+        if len(ocr_text) <= _MAX_PREVIEW_CHARS:
+            preview_text = ocr_text
+        else:
+            preview_text = ocr_text[:_MAX_PREVIEW_CHARS] + '\n…[truncated]'
+
+        # Independent post-processing stages run concurrently while the
+        # lightweight text outputs below are assembled on this thread
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            structured_future = pool.submit(
+                _STRUCTURED.process, ocr_text, tables_html_list
+            )
+            xml_future = pool.submit(converter.to_xml, parsed)
+            bbox_future = None
+            if result.processed_images:
+                bbox_future = pool.submit(
+                    create_bounding_box_visualization,
+                    result.processed_images[0], preview_text, inplace=True
+                )
+            fields_future = pool.submit(
+                extractor.extract, ocr_text, enabled_fields, custom_fields
+            )
 
-        # XML output
-        xml_output = converter.to_xml(parsed)
+            # HTML preview (truncated before the replace to bound the copy)
+            ocr_html = preview_text.replace('\n', '<br>')
+            full_html = f"""
+            <div style="font-family: Arial, sans-serif; padding: 20px; background: #f5f5f5; border-radius: 8px;">
+                <h2 style="color: #333; border-bottom: 2px solid #4CAF50; padding-bottom: 10px;">Document Preview</h2>
+                <div style="background: white; padding: 15px; border-radius: 5px; margin-top: 15px; line-height: 1.6;">
+                    {ocr_html}
+                </div>
+            </div>
+            """
+
+            # Tables
+            html_tables = converter.get_all_tables_html(parsed)
+            csv_tables = []
+            for page in parsed.pages:
+                csv_tables.extend(page.tables_csv)
+            csv_output = "\n\n".join(csv_tables) if csv_tables else "No tables found."
+
+            # Equations
+            equations_output = converter.get_all_equations(parsed)
+
+            # Images, watermarks, page numbers
+            images_output = []
+            watermarks_output = []
+            page_numbers_output = []
+
+            for page in parsed.pages:
+                for i, desc in enumerate(page.image_descriptions):
+                    images_output.append(f"Page {page.page_number}, Image {i + 1}: {desc}")
+                for i, wm in enumerate(page.watermarks):
+                    watermarks_output.append(f"Page {page.page_number}, Watermark {i + 1}: {wm}")
+                for i, pn in enumerate(page.page_numbers_extracted):
+                    page_numbers_output.append(f"Page {page.page_number}: {pn}")
+
+            images_str = "\n".join(images_output) if images_output else "No image descriptions found."
+            watermarks_str = "\n".join(watermarks_output) if watermarks_output else "No watermarks found."
+            page_nums_str = "\n".join(page_numbers_output) if page_numbers_output else "No page numbers found."
+
+            structured_result = structured_future.result()
+            xml_output = xml_future.result()
+            bbox_image = bbox_future.result() if bbox_future else None
+            field_results = fields_future.result()
 
-        # Bounding box visualization
-        bbox_image = None
-        if result.processed_images:
-            bbox_image = create_bounding_box_visualization(
-                result.processed_images[0], ocr_text
-            )
+        # JSON output using structured processor
+        json_output = dumps(structured_result)
 
         # Field extraction
-        custom_fields = [custom_field_1, custom_field_2, custom_field_3,
-                         custom_field_4, custom_field_5, custom_field_6,
-                         custom_field_7, custom_field_8, custom_field_9,
-                         custom_field_10]
-        custom_fields = [f.strip() for f in custom_fields if f and f.strip()]
-
-        extractor = FieldExtractor()
-        field_results = extractor.extract(ocr_text, enabled_fields, custom_fields)
         api_data = extractor.to_dict(field_results)
 
         # API v1 request/response
         total_ms = int((time.time() - process_start) * 1000)
         api_request = generate_api_request(
             api_endpoint, api_key, api_method, api_data,
-            webhook_url, confidence_threshold, output_format
+            webhook_url, confidence_threshold, output_format,
+            request_id=req_id, timestamp=now_iso
         )
         api_request["response"]["processing_time_ms"] = total_ms
-        api_v1_json = json.dumps(api_request, indent=2)
+        api_v1_json = dumps(api_request)
 
         # API v2 request/response (structured output format)
-        request_id = str(uuid.uuid4())
         api_v2_response = {
             "api_version": "2.0",
-            "job_id": request_id,
+            "job_id": req_id,
             "status": "completed",
             "processing_time_ms": total_ms,
             "document": {
@@ -237,15 +373,15 @@ def process_document_for_ui(file, max_new_tokens, max_image_size,
             },
             "result": structured_result
         }
-        api_v2_json = json.dumps(api_v2_response, indent=2)
+        api_v2_json = dumps(api_v2_response)
 
         # Webhook payload using real extracted data
         webhook_payload = {
             "event": "document.processed",
-            "event_id": str(uuid.uuid4()),
-            "timestamp": datetime.now().isoformat(),
+            "event_id": evt_id,
+            "timestamp": now_iso,
             "webhook_url": webhook_url if webhook_url else "https://api.example.com/webhooks/ocr",
-            "request_id": request_id,
+            "request_id": req_id,
             "status": "completed",
             "delivery": {
                 "attempt": 1,
@@ -253,7 +389,7 @@ def process_document_for_ui(file, max_new_tokens, max_image_size,
                 "status": "delivered" if webhook_url else "simulated"
             },
             "data": {
-                "document_id": request_id,
+                "document_id": req_id,
                 "document_type": structured_result['document_type'],
                 "language": structured_result['language'],
                 "extracted_fields": structured_result['extracted_fields'],
@@ -265,44 +401,33 @@ def process_document_for_ui(file, max_new_tokens, max_image_size,
                     "confidence": structured_result['confidence']
                 }
             },
-            "signature": f"sha256={hashlib.sha256(json.dumps(structured_result['extracted_fields']).encode()).hexdigest()[:32]}"
+            "signature": f"blake2b={hashlib.blake2b(dumps_bytes(structured_result['extracted_fields']), digest_size=16).hexdigest()}"
         }
-        webhook_json = json.dumps(webhook_payload, indent=2)
+        webhook_json = dumps(webhook_payload)
 
         # Statistics
         stats = extractor.get_statistics(field_results)
-        stats_output = f"""
-Processing Statistics:
-
-Document Information:
-- Filename: {result.metadata.filename}
-- File Size: {result.metadata.file_size_mb} MB
-- File Type: {result.metadata.file_type}
-- Total Pages: {result.metadata.total_pages}
-
-Document Classification:
-- Document Type: {structured_result['document_type']}
-- Classification Confidence: {structured_result['confidence']}
-- Language: {structured_result['language']}
-
-Processing Metrics:
-- Total Processing Time: {processing_time}
-- API Response Time: {total_ms} ms
-
-Extraction Results:
-- Total Fields: {stats['total_fields']}
-- Fields Found: {stats['fields_found']}
-- Fields Empty: {stats['fields_empty']}
-- Success Rate: {stats['success_rate']}%
-- Entities Extracted: {len(structured_result['entities'])}
-- Line Items Found: {len(structured_result['line_items'])}
-
-Content Detection:
-- Tables Found: {sum(len(p.tables_html) for p in parsed.pages)}
-- Equations Found: {sum(len(p.latex_equations) for p in parsed.pages)}
-- Images Found: {sum(len(p.image_descriptions) for p in parsed.pages)}
-- Watermarks Found: {sum(len(p.watermarks) for p in parsed.pages)}
-"""
+        stats_output = _STATS_TEMPLATE.format_map({
+            "filename": result.metadata.filename,
+            "file_size_mb": result.metadata.file_size_mb,
+            "file_type": result.metadata.file_type,
+            "total_pages": result.metadata.total_pages,
+            "document_type": structured_result['document_type'],
+            "confidence": structured_result['confidence'],
+            "language": structured_result['language'],
+            "processing_time": processing_time,
+            "total_ms": total_ms,
+            "total_fields": stats['total_fields'],
+            "fields_found": stats['fields_found'],
+            "fields_empty": stats['fields_empty'],
+            "success_rate": stats['success_rate'],
+            "entities": len(structured_result['entities']),
+            "line_items": len(structured_result['line_items']),
+            "tables": len(tables_html_list),
+            "equations": sum(len(p.latex_equations) for p in parsed.pages),
+            "images": len(images_output),
+            "watermarks": len(watermarks_output),
+        })
 
         return (ocr_text, processing_time, full_html, html_tables,
                 csv_output, equations_output, images_str,
@@ -310,12 +435,12 @@ Content Detection:
                 bbox_image, api_v1_json, api_v2_json, webhook_json, stats_output)
 
     except Exception as e:
-        return (f"Error: {str(e)}", "0:00:00", "", "", "", "", "",
-                "", "", "", "", None, "", "", "", "")
+        return (f"Error: {str(e)}", "0:00:00") + _EMPTY_OUTPUTS
 
 
+@lru_cache(maxsize=1)
 def get_sample_documents():
-    """Get sample document paths from tests/asset directory."""
+    """Get sample document paths from tests/asset directory (cached)."""
     import os
 
     # Get path to tests/asset directory
@@ -342,11 +467,14 @@ def get_sample_documents():
                 samples.append(filepath)
                 sample_names.append(name)
 
-    return samples, sample_names
+    return tuple(samples), tuple(sample_names)
 
 
 def create_gradio_interface():
-    """Create and return the Gradio interface."""
+    """Create and return the Gradio interface (queue configured)."""
+
+    # Build the shared helpers before the first request
+    _init_singletons()
 
     # Get sample documents
     sample_images, sample_names = get_sample_documents()
@@ -491,18 +619,15 @@ def create_gradio_interface():
                         )
 
                         gr.Markdown("### Custom Fields")
-                        with gr.Row():
-                            custom_field_1 = gr.Textbox(label="Custom 1", placeholder="e.g., Tax ID")
-                            custom_field_2 = gr.Textbox(label="Custom 2", placeholder="e.g., Reference")
-                            custom_field_3 = gr.Textbox(label="Custom 3")
-                            custom_field_4 = gr.Textbox(label="Custom 4")
-                            custom_field_5 = gr.Textbox(label="Custom 5")
-                        with gr.Row():
-                            custom_field_6 = gr.Textbox(label="Custom 6")
-                            custom_field_7 = gr.Textbox(label="Custom 7")
-                            custom_field_8 = gr.Textbox(label="Custom 8")
-                            custom_field_9 = gr.Textbox(label="Custom 9")
-                            custom_field_10 = gr.Textbox(label="Custom 10")
+                        custom_fields_df = gr.Dataframe(
+                            headers=["Custom Field"],
+                            datatype=["str"],
+                            row_count=(10, "fixed"),
+                            col_count=(1, "fixed"),
+                            type="array",
+                            label="Custom fields (e.g., Tax ID, Reference)",
+                            interactive=True
+                        )
 
                     # API Configuration
                     with gr.TabItem("API"):
@@ -567,10 +692,10 @@ def create_gradio_interface():
                                     "confidence": 0.94
                                 }
                             },
-                            "signature": "sha256=a1b2c3d4e5f6..."
+                            "signature": "blake2b=a1b2c3d4e5f6..."
                         }
                         gr.Code(
-                            value=json.dumps(sample_webhook, indent=2),
+                            value=dumps(sample_webhook),
                             language="json",
                             label="Example Payload",
                             lines=25,
@@ -582,11 +707,7 @@ def create_gradio_interface():
             fn=process_document_for_ui,
             inputs=[
                 file_input, max_tokens_slider, max_image_size_slider,
-                field_checkboxes,
-                custom_field_1, custom_field_2, custom_field_3,
-                custom_field_4, custom_field_5, custom_field_6,
-                custom_field_7, custom_field_8, custom_field_9,
-                custom_field_10,
+                field_checkboxes, custom_fields_df,
                 api_endpoint, api_key, api_method, webhook_url,
                 confidence_threshold, output_format, enable_batch
             ],
@@ -599,6 +720,9 @@ def create_gradio_interface():
             ]
         )
 
+    # Up to two handlers run at once; model calls are serialized by _MODEL_LOCK
+    demo.queue(default_concurrency_limit=2, max_size=16)
+
     return demo
 
 
@@ -609,6 +733,8 @@ def run_ui(preload_model: bool = True):
         preload_model: If True, initialize model before launching UI.
     """
     if preload_model:
+        from core.ocr_engine import get_ocr_engine
+
         print("Initializing OCR engine...")
         engine = get_ocr_engine()
         engine.initialize()
@@ -11,20 +11,161 @@ warnings.filterwarnings("ignore", message=".*bcrypt.*")
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
 import gradio as gr
-import json
+import csv
+import hashlib
+import html
+import io
 import os
 import re
-from datetime import datetime
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from xml.sax.saxutils import escape
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
 from ui.api_client import get_api_client, OCRAPIClient
+from utils.serialization import dumps, dumps_bytes
 
+# Detection patterns for the bounding box visualization
+_RE_TABLE = re.compile(r'<table', re.IGNORECASE)
+_RE_EQUATION = re.compile(r'\$\$[^$]+\$\$|\$[^$]+\$|\\begin\{equation\}')
+_RE_IMAGE = re.compile(r'<img>.*?</img>|\[Image:', re.IGNORECASE)
+_RE_WATERMARK = re.compile(r'watermark|confidential|draft|sample', re.IGNORECASE)
 
-def create_bounding_box_visualization(image: Image.Image, ocr_text: str) -> Image.Image:
-    """Create visualization with bounding boxes for detected elements."""
-    img_with_boxes = image.copy()
-    draw = ImageDraw.Draw(img_with_boxes)
+# Only the head and tail of very long OCR text are scanned for detections
+_SCAN_WINDOW_CHARS = 65536
+
+# Largest number of queued submissions Gradio hands to one batched call
+_MAX_BATCH_SIZE = 8
+
+# Extra entities for escaping XML attribute values
+_XML_ATTR_ENTITIES = {'"': "&quot;"}
+
+# Shown in the XML tab when another output format is selected
+_XML_PLACEHOLDER = "Select XML output format to render"
+
+# Static wrappers for the HTML preview (%-substituted) and XML tab (str.format)
+_FULL_HTML_TMPL = """
+        <div style="font-family: Arial, sans-serif; padding: 20px; background: #f5f5f5; border-radius: 8px;">
+            <h2 style="color: #333; border-bottom: 2px solid #4CAF50; padding-bottom: 10px;">Document Preview</h2>
+            <div style="background: white; padding: 15px; border-radius: 5px; margin-top: 15px; line-height: 1.6;">
+                %s
+            </div>
+        </div>
+        """
+
+_XML_TMPL = """<?xml version="1.0" encoding="UTF-8"?>
+<document>
+    <metadata>
+        <filename>{filename}</filename>
+        <file_type>{file_type}</file_type>
+        <total_pages>{total_pages}</total_pages>
+    </metadata>
+    <document_type>{document_type}</document_type>
+    <language>{language}</language>
+    <confidence>{confidence}</confidence>
+    <extracted_fields>
+        {fields}
+    </extracted_fields>
+</document>"""
+
+
+
+
+# Example payload shown on the Webhooks tab, serialized once at import
+SAMPLE_WEBHOOK = {
+    "event": "document.processed",
+    "event_id": "evt_1234567890abcdef",
+    "timestamp": "2024-01-15T10:30:00Z",
+    "webhook_url": "https://api.example.com/webhooks/ocr",
+    "request_id": "req_abcdef1234567890",
+    "status": "completed",
+    "delivery": {
+        "attempt": 1,
+        "max_attempts": 3,
+        "status": "delivered"
+    },
+    "data": {
+        "document_id": "doc_xyz789",
+        "extracted_fields": {
+            "invoice_number": "INV-2024-001",
+            "total_amount": "$1,250.00",
+            "vendor_name": "Acme Corp"
+        },
+        "metadata": {
+            "pages": 2,
+            "processing_time_ms": 1523,
+            "confidence": 0.94
+        }
+    },
+    "signature": "sha256=a1b2c3d4e5f6..."
+}
 
+_SAMPLE_WEBHOOK_JSON = dumps(SAMPLE_WEBHOOK)
+
+
+# Last successful health check per server: (base_url, api_key) -> (timestamp, response)
+_HEALTH_CACHE = {}
+_HEALTH_TTL_SECONDS = 30
+
+
+def _cached_health_check(client: OCRAPIClient, ttl: float = _HEALTH_TTL_SECONDS):
+    """Return a recent successful health check for client, or run a new one."""
+    now = time.monotonic()
+    key = (client.base_url, client.api_key)
+    cached = _HEALTH_CACHE.get(key)
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+    health = client.health_check()
+    if health.success:
+        _HEALTH_CACHE[key] = (now, health)
+    else:
+        _HEALTH_CACHE.pop(key, None)
+    return health
+
+
+def _line_items_csv(line_items) -> str:
+    """Render line items as CSV with a header row."""
+    # csv.writer quotes values containing commas, quotes or newlines
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+    writer.writerow(["Description", "Quantity", "Unit Price", "Total"])
+    writer.writerows(
+        (item.get('description', ''), item.get('quantity', ''),
+         item.get('unit_price', ''), item.get('total', ''))
+        for item in line_items
+    )
+    return buf.getvalue()
+
+
+def _structured_xml(doc_info, structured_result, extracted_fields) -> str:
+    """Render the structured result as the simplified XML document."""
+    fields_xml = "\n        ".join(
+        f'<field name="{escape(str(k), _XML_ATTR_ENTITIES)}">{escape(str(v))}</field>'
+        for k, v in extracted_fields.items()
+    )
+    return _XML_TMPL.format(
+        filename=escape(str(doc_info.get('filename', ''))),
+        file_type=escape(str(doc_info.get('file_type', ''))),
+        total_pages=doc_info.get('total_pages', 1),
+        document_type=escape(str(structured_result.get('document_type', ''))),
+        language=escape(str(structured_result.get('language', ''))),
+        confidence=structured_result.get('confidence', 0),
+        fields=fields_xml,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_font():
+    """Load the annotation font once, trying common system font paths."""
     try:
         # Try common font paths
         font_paths = [
@@ -32,15 +173,25 @@ def create_bounding_box_visualization(image: Image.Image, ocr_text: str) -> Imag
             "C:/Windows/Fonts/arial.ttf",
             "/System/Library/Fonts/Helvetica.ttc"
         ]
-        font = None
         for path in font_paths:
             if os.path.exists(path):
-                font = ImageFont.truetype(path, 14)
-                break
-        if font is None:
-            font = ImageFont.load_default()
-    except:
-        font = ImageFont.load_default()
+                return ImageFont.truetype(path, 14)
+    except Exception:
+        pass
+    return ImageFont.load_default()
+
+
+def create_bounding_box_visualization(image: Image.Image, ocr_text: str,
+                                      inplace: bool = False) -> Image.Image:
+    """Create visualization with bounding boxes for detected elements.
+
+    With ``inplace=True`` the boxes are drawn directly onto ``image``; only
+    pass it when the caller does not reuse the source pixels.
+    """
+    img_with_boxes = image if inplace else image.copy()
+    draw = ImageDraw.Draw(img_with_boxes)
+
+    font = _get_font()
 
     colors = {
         'table': (255, 0, 0),      # Red
@@ -53,33 +204,35 @@ def create_bounding_box_visualization(image: Image.Image, ocr_text: str) -> Imag
     width, height = img_with_boxes.size
     y_offset = 10
 
-    # Draw indicators for detected elements
-    from bs4 import BeautifulSoup
+    if len(ocr_text) <= 2 * _SCAN_WINDOW_CHARS:
+        scan_text = ocr_text
+    else:
+        scan_text = ocr_text[:_SCAN_WINDOW_CHARS] + ocr_text[-_SCAN_WINDOW_CHARS:]
 
+    # Draw indicators for detected elements
     # Check for tables
-    soup = BeautifulSoup(ocr_text, 'html.parser')
-    if soup.find_all('table') or '<table' in ocr_text.lower():
+    if _RE_TABLE.search(scan_text):
         draw.rectangle([(10, y_offset), (width - 10, y_offset + 40)],
                        outline=colors['table'], width=3)
         draw.text((15, y_offset + 5), "📊 Table Detected", fill=colors['table'], font=font)
         y_offset += 50
 
     # Check for equations (LaTeX style)
-    if re.search(r'\$\$[^$]+\$\$|\$[^$]+\$|\\begin\{equation\}', ocr_text):
+    if _RE_EQUATION.search(scan_text):
         draw.rectangle([(10, y_offset), (width - 10, y_offset + 40)],
                        outline=colors['equation'], width=3)
         draw.text((15, y_offset + 5), "🔢 Equation Detected", fill=colors['equation'], font=font)
         y_offset += 50
 
     # Check for images
-    if re.search(r'<img>.*?</img>|\[Image:', ocr_text, re.IGNORECASE):
+    if _RE_IMAGE.search(scan_text):
         draw.rectangle([(10, y_offset), (width - 10, y_offset + 40)],
                        outline=colors['image'], width=3)
         draw.text((15, y_offset + 5), "🖼️ Image Detected", fill=colors['image'], font=font)
         y_offset += 50
 
     # Check for watermarks
-    if re.search(r'watermark|confidential|draft|sample', ocr_text, re.IGNORECASE):
+    if _RE_WATERMARK.search(scan_text):
         draw.rectangle([(10, y_offset), (width - 10, y_offset + 40)],
                        outline=colors['watermark'], width=3)
         draw.text((15, y_offset + 5), "💧 Watermark Detected", fill=colors['watermark'], font=font)
@@ -112,8 +265,9 @@ PREDEFINED_FIELDS = [
 ]
 
 
+@lru_cache(maxsize=1)
 def get_sample_documents():
-    """Get sample document paths from tests/asset directory."""
+    """Get sample document paths from tests/asset directory (cached)."""
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     asset_dir = os.path.join(base_dir, "tests", "asset")
 
@@ -134,7 +288,7 @@ def get_sample_documents():
             if os.path.exists(filepath):
                 samples.append(filepath)
 
-    return samples
+    return tuple(samples)
 
 
 def process_document_via_api(
@@ -158,8 +312,8 @@ def process_document_via_api(
         # Use the configured API endpoint
         client = get_api_client(base_url=api_endpoint, api_key=api_key)
         
-        # Check API connection first
-        health = client.health_check()
+        # Check API connection first (reuses a recent successful check)
+        health = _cached_health_check(client)
         if not health.success:
             error_msg = f"API Connection Failed: {health.error}"
             return (error_msg, "0:00:00", "", "", "", "", "",
@@ -188,27 +342,42 @@ def process_document_via_api(
         # OCR text - check multiple possible locations
         raw_data = structured_result.get("raw", {})
         ocr_text = raw_data.get("text", "") or structured_result.get("raw_text", "") or ""
-        
-        # If still empty, try to get from tables or other sources
-        if not ocr_text and raw_data.get("pages"):
-            # Combine text from all pages
-            page_texts = []
-            for page in raw_data.get("pages", []):
-                if page.get("text"):
-                    page_texts.append(page.get("text", ""))
+
+        # Single pass over the pages for text, equations, watermarks,
+        # image descriptions and page numbers
+        page_texts = []
+        equations_list = []
+        watermarks_list = []
+        images_list = []
+        page_numbers_list = []
+
+        for page in raw_data.get("pages") or []:
+            pg = page.get
+            page_no = pg('page_number', '?')
+            text = pg("text")
+            if text:
+                page_texts.append(text)
+            # Equations (LaTeX)
+            equations_list.extend(pg("latex_equations") or ())
+            # Watermarks
+            for wm in pg("watermarks") or ():
+                watermarks_list.append(f"Page {page_no}: {wm}")
+            # Image descriptions
+            for i, desc in enumerate(pg("image_descriptions") or ()):
+                images_list.append(f"Page {page_no}, Image {i+1}: {desc}")
+            # Page numbers
+            for pn in pg("page_numbers_extracted") or ():
+                page_numbers_list.append(f"Page {page_no}: {pn}")
+
+        # If still empty, combine text from all pages
+        if not ocr_text:
             ocr_text = "\n\n".join(page_texts)
 
 
         # HTML preview
-        ocr_html = ocr_text.replace('\n', '<br>')
-        full_html = f"""
-        <div style="font-family: Arial, sans-serif; padding: 20px; background: #f5f5f5; border-radius: 8px;">
-            <h2 style="color: #333; border-bottom: 2px solid #4CAF50; padding-bottom: 10px;">Document Preview</h2>
-            <div style="background: white; padding: 15px; border-radius: 5px; margin-top: 15px; line-height: 1.6;">
-                {ocr_html}
-            </div>
-        </div>
-        """
+        # Escape first so markup in the OCR text cannot inject into the page
+        ocr_html = html.escape(ocr_text).replace('\n', '<br>')
+        full_html = _FULL_HTML_TMPL % ocr_html
 
         # Tables HTML - try to use raw HTML tables first, then line items
         raw_tables = raw_data.get("tables_html", [])
@@ -216,56 +385,32 @@ def process_document_via_api(
         
         if raw_tables:
             # Use the raw HTML tables from the OCR
-            html_tables = "<div style='padding: 10px;'>"
+            parts = ["<div style='padding: 10px;'>"]
             for i, table in enumerate(raw_tables):
-                html_tables += f"<h4>Table {i+1}</h4>{table}<br><br>"
-            html_tables += "</div>"
+                parts.append(f"<h4>Table {i+1}</h4>{table}<br><br>")
+            parts.append("</div>")
+            html_tables = "".join(parts)
         elif line_items:
-            html_tables = "<table border='1' style='border-collapse: collapse; width: 100%;'>"
-            html_tables += "<tr style='background: #4CAF50; color: white;'>"
-            html_tables += "<th style='padding: 8px;'>Description</th>"
-            html_tables += "<th style='padding: 8px;'>Quantity</th>"
-            html_tables += "<th style='padding: 8px;'>Unit Price</th>"
-            html_tables += "<th style='padding: 8px;'>Total</th></tr>"
+            parts = [
+                "<table border='1' style='border-collapse: collapse; width: 100%;'>",
+                "<tr style='background: #4CAF50; color: white;'>",
+                "<th style='padding: 8px;'>Description</th>",
+                "<th style='padding: 8px;'>Quantity</th>",
+                "<th style='padding: 8px;'>Unit Price</th>",
+                "<th style='padding: 8px;'>Total</th></tr>",
+            ]
             for item in line_items:
-                html_tables += f"<tr><td style='padding: 8px;'>{item.get('description', '')}</td>"
-                html_tables += f"<td style='padding: 8px; text-align: center;'>{item.get('quantity', '')}</td>"
-                html_tables += f"<td style='padding: 8px; text-align: right;'>{item.get('unit_price', '')}</td>"
-                html_tables += f"<td style='padding: 8px; text-align: right;'>{item.get('total', '')}</td></tr>"
-            html_tables += "</table>"
+                parts.append(f"<tr><td style='padding: 8px;'>{item.get('description', '')}</td>")
+                parts.append(f"<td style='padding: 8px; text-align: center;'>{item.get('quantity', '')}</td>")
+                parts.append(f"<td style='padding: 8px; text-align: right;'>{item.get('unit_price', '')}</td>")
+                parts.append(f"<td style='padding: 8px; text-align: right;'>{item.get('total', '')}</td></tr>")
+            parts.append("</table>")
+            html_tables = "".join(parts)
         else:
             html_tables = "<p>No tables found in document.</p>"
 
         # CSV tables
-        csv_output = "Description,Quantity,Unit Price,Total\n"
-        for item in line_items:
-            csv_output += f"{item.get('description', '')},{item.get('quantity', '')},{item.get('unit_price', '')},{item.get('total', '')}\n"
-        if not line_items:
-            csv_output = "No tables found."
-
-        # Extract equations, watermarks, images from pages
-        equations_list = []
-        watermarks_list = []
-        images_list = []
-        page_numbers_list = []
-        
-        for page in raw_data.get("pages", []):
-            # Equations (LaTeX)
-            if page.get("latex_equations"):
-                for eq in page.get("latex_equations", []):
-                    equations_list.append(eq)
-            # Watermarks
-            if page.get("watermarks"):
-                for wm in page.get("watermarks", []):
-                    watermarks_list.append(f"Page {page.get('page_number', '?')}: {wm}")
-            # Image descriptions
-            if page.get("image_descriptions"):
-                for i, desc in enumerate(page.get("image_descriptions", [])):
-                    images_list.append(f"Page {page.get('page_number', '?')}, Image {i+1}: {desc}")
-            # Page numbers
-            if page.get("page_numbers_extracted"):
-                for pn in page.get("page_numbers_extracted", []):
-                    page_numbers_list.append(f"Page {page.get('page_number', '?')}: {pn}")
+        csv_output = _line_items_csv(line_items) if line_items else "No tables found."
 
         equations_output = "\n".join(equations_list) if equations_list else "No equations found."
         watermarks_str = "\n".join(watermarks_list) if watermarks_list else "No watermarks detected."
@@ -273,24 +418,15 @@ def process_document_via_api(
         page_nums_str = "\n".join(page_numbers_list) if page_numbers_list else f"Total Pages: {doc_info.get('total_pages', 1)}"
 
 
+        extracted_fields = structured_result.get('extracted_fields', {})
+
         # JSON output
-        json_output = json.dumps(structured_result, indent=2)
+        json_output = dumps(structured_result)
 
-        # XML output (simplified)
-        xml_output = f"""<?xml version="1.0" encoding="UTF-8"?>
-<document>
-    <metadata>
-        <filename>{doc_info.get('filename', '')}</filename>
-        <file_type>{doc_info.get('file_type', '')}</file_type>
-        <total_pages>{doc_info.get('total_pages', 1)}</total_pages>
-    </metadata>
-    <document_type>{structured_result.get('document_type', '')}</document_type>
-    <language>{structured_result.get('language', '')}</language>
-    <confidence>{structured_result.get('confidence', 0)}</confidence>
-    <extracted_fields>
-        {chr(10).join([f'        <field name="{k}">{v}</field>' for k, v in structured_result.get('extracted_fields', {}).items()])}
-    </extracted_fields>
-</document>"""
+        # XML output (simplified), only built when XML is the selected format
+        xml_output = _XML_PLACEHOLDER
+        if output_format == "XML":
+            xml_output = _structured_xml(doc_info, structured_result, extracted_fields)
 
         # Bounding box visualization - load the uploaded file
         bbox_image = None
@@ -300,25 +436,32 @@ def process_document_via_api(
             if file_ext in ['.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff']:
                 # Load image directly
                 uploaded_image = Image.open(file.name)
-                if uploaded_image.mode != 'RGB':
+                if uploaded_image.format == 'JPEG':
+                    # Let libjpeg decode at a reduced scale near max_image_size
+                    size = int(max_image_size)
+                    uploaded_image.draft('RGB', (size, size))
+                # The overlay draws fine on RGBA, so only convert other modes
+                if uploaded_image.mode not in ('RGB', 'RGBA'):
                     uploaded_image = uploaded_image.convert('RGB')
-                bbox_image = create_bounding_box_visualization(uploaded_image, ocr_text)
+                bbox_image = create_bounding_box_visualization(uploaded_image, ocr_text, inplace=True)
                 
             elif file_ext == '.pdf':
                 # Try to extract first page from PDF as image
-                try:
-                    import fitz  # PyMuPDF
+                if fitz is not None:
                     pdf_doc = fitz.open(file.name)
                     if len(pdf_doc) > 0:
                         page = pdf_doc[0]
-                        # Render at 150 DPI for good quality
-                        mat = fitz.Matrix(150/72, 150/72)
-                        pix = page.get_pixmap(matrix=mat)
+                        # The preview only carries status overlays, so render at
+                        # most 100 DPI and no larger than max_image_size
+                        longest_side = max(page.rect.width, page.rect.height)
+                        target_dpi = min(100, 72 * max_image_size / longest_side)
+                        mat = fitz.Matrix(target_dpi / 72, target_dpi / 72)
+                        pix = page.get_pixmap(matrix=mat, alpha=False)
                         # Convert to PIL Image
                         uploaded_image = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                        bbox_image = create_bounding_box_visualization(uploaded_image, ocr_text)
+                        bbox_image = create_bounding_box_visualization(uploaded_image, ocr_text, inplace=True)
                     pdf_doc.close()
-                except ImportError:
+                else:
                     # PyMuPDF not available, create a placeholder
                     placeholder = Image.new('RGB', (800, 600), color=(245, 245, 245))
                     draw = ImageDraw.Draw(placeholder)
@@ -333,7 +476,7 @@ def process_document_via_api(
 
 
         # API v1 request/response (simulated from v2 data)
-        api_v1_json = json.dumps({
+        api_v1_json = dumps({
             "request": {
                 "endpoint": api_endpoint,
                 "method": api_method,
@@ -350,22 +493,20 @@ def process_document_via_api(
                 "status": "success",
                 "status_code": 200,
                 "processing_time_ms": processing_time_ms,
-                "extracted_fields": structured_result.get("extracted_fields", {})
+                "extracted_fields": extracted_fields
             }
-        }, indent=2)
+        })
 
         # API v2 response
-        api_v2_json = json.dumps(data, indent=2)
+        api_v2_json = dumps(data)
 
         # Webhook payload
-        import uuid
-        import hashlib
         webhook_payload = {
             "event": "document.processed",
-            "event_id": str(uuid.uuid4()),
-            "timestamp": datetime.now().isoformat(),
+            "event_id": uuid.uuid4().hex,
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
             "webhook_url": webhook_url if webhook_url else "https://api.example.com/webhooks/ocr",
-            "request_id": data.get("job_id", str(uuid.uuid4())),
+            "request_id": data.get("job_id") or uuid.uuid4().hex,
             "status": "completed",
             "delivery": {
                 "attempt": 1,
@@ -376,7 +517,7 @@ def process_document_via_api(
                 "document_id": data.get("job_id", ""),
                 "document_type": structured_result.get('document_type', ''),
                 "language": structured_result.get('language', ''),
-                "extracted_fields": structured_result.get('extracted_fields', {}),
+                "extracted_fields": extracted_fields,
                 "line_items": line_items[:10],  # Limit for readability
                 "entities": structured_result.get('entities', [])[:10],
                 "metadata": {
@@ -385,14 +526,17 @@ def process_document_via_api(
                     "confidence": structured_result.get('confidence', 0)
                 }
             },
-            "signature": f"sha256={hashlib.sha256(json.dumps(structured_result.get('extracted_fields', {})).encode()).hexdigest()[:32]}"
+            "signature": f"sha256={hashlib.sha256(dumps_bytes(extracted_fields)).hexdigest()[:32]}"
         }
-        webhook_json = json.dumps(webhook_payload, indent=2)
+        webhook_json = dumps(webhook_payload)
 
         # Statistics
-        extracted_fields = structured_result.get('extracted_fields', {})
         entities = structured_result.get('entities', [])
-        
+        fields_found = sum(1 for v in extracted_fields.values() if v)
+        fields_empty = len(extracted_fields) - fields_found
+        # str.count scans without building a list of lines
+        line_count = ocr_text.count('\n') + 1
+
         stats_output = f"""
 Processing Statistics:
 
@@ -415,8 +559,8 @@ Processing Metrics:
 
 Extraction Results:
 - Total Fields: {len(extracted_fields)}
-- Fields Found: {sum(1 for v in extracted_fields.values() if v)}
-- Fields Empty: {sum(1 for v in extracted_fields.values() if not v)}
+- Fields Found: {fields_found}
+- Fields Empty: {fields_empty}
 - Entities Extracted: {len(entities)}
 - Line Items Found: {len(line_items)}
 - Tables Found: {len(raw_tables)}
@@ -427,7 +571,7 @@ Extraction Results:
 OCR Text:
 - Characters: {len(ocr_text):,}
 - Words: {len(ocr_text.split()):,}
-- Lines: {len(ocr_text.split(chr(10))):,}
+- Lines: {line_count:,}
 
 API Connection:
 - Endpoint: {api_endpoint}
@@ -441,12 +585,28 @@ API Connection:
                 bbox_image, api_v1_json, api_v2_json, webhook_json, stats_output)
 
     except Exception as e:
-        import traceback
         error_msg = f"Error: {str(e)}\n\n{traceback.format_exc()}"
         return (error_msg, "0:00:00", "", "", "", "", "",
                 "", "", "", "", None, "", "", "", "")
 
 
+def process_documents_batch(*batched_inputs):
+    """Batched Gradio handler: one list per input in, one list per output out.
+
+    Every submission in the batch is sent to the API concurrently over the
+    pooled client session (the backend serializes model work), so a batch
+    takes about as long as its slowest document.
+    """
+    submissions = list(zip(*batched_inputs))
+    if len(submissions) == 1:
+        results = [process_document_via_api(*submissions[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=len(submissions)) as pool:
+            results = list(pool.map(lambda args: process_document_via_api(*args), submissions))
+
+    return tuple(list(column) for column in zip(*results))
+
+
 def create_gradio_interface(default_api_url: str = "http://localhost:8000"):
     """Create and return the Gradio interface (matching original app.py)."""
 
@@ -669,35 +829,8 @@ def create_gradio_interface(default_api_url: str = "http://localhost:8000"):
                         """)
 
                         gr.Markdown("### Sample Webhook Payload")
-                        sample_webhook = {
-                            "event": "document.processed",
-                            "event_id": "evt_1234567890abcdef",
-                            "timestamp": "2024-01-15T10:30:00Z",
-                            "webhook_url": "https://api.example.com/webhooks/ocr",
-                            "request_id": "req_abcdef1234567890",
-                            "status": "completed",
-                            "delivery": {
-                                "attempt": 1,
-                                "max_attempts": 3,
-                                "status": "delivered"
-                            },
-                            "data": {
-                                "document_id": "doc_xyz789",
-                                "extracted_fields": {
-                                    "invoice_number": "INV-2024-001",
-                                    "total_amount": "$1,250.00",
-                                    "vendor_name": "Acme Corp"
-                                },
-                                "metadata": {
-                                    "pages": 2,
-                                    "processing_time_ms": 1523,
-                                    "confidence": 0.94
-                                }
-                            },
-                            "signature": "sha256=a1b2c3d4e5f6..."
-                        }
                         gr.Code(
-                            value=json.dumps(sample_webhook, indent=2),
+                            value=_SAMPLE_WEBHOOK_JSON,
                             language="json",
                             label="Example Payload",
                             lines=25,
@@ -706,7 +839,7 @@ def create_gradio_interface(default_api_url: str = "http://localhost:8000"):
 
         # Connect button
         process_button.click(
-            fn=process_document_via_api,
+            fn=process_documents_batch,
             inputs=[
                 file_input, max_tokens_slider, max_image_size_slider,
                 field_checkboxes,
@@ -723,7 +856,9 @@ def create_gradio_interface(default_api_url: str = "http://localhost:8000"):
                 image_descriptions, watermarks, page_numbers,
                 json_output, xml_output, bbox_image,
                 api_v1_viewer, api_v2_viewer, webhook_output, stats_output
-            ]
+            ],
+            batch=True,
+            max_batch_size=_MAX_BATCH_SIZE
         )
 
     return demo
@@ -1,9 +1,14 @@
 """
 Structured JSON logging for production with context tracking and audit trail.
 """
+import atexit
 import logging
+import logging.handlers
 import json
+import os
+import queue
 import sys
+import threading
 import uuid
 import time
 from datetime import datetime
@@ -11,6 +16,12 @@ from typing import Optional, Any, Dict
 from contextvars import ContextVar
 from functools import wraps
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from config import settings
 
 # Context variables for request tracking
@@ -19,12 +30,17 @@ user_id_var: ContextVar[str] = ContextVar('user_id', default='')
 tenant_id_var: ContextVar[str] = ContextVar('tenant_id', default='')
 
 
+def _read_context() -> tuple:
+    """Read the (request_id, user_id, tenant_id) context of the current task."""
+    return request_id_var.get(), user_id_var.get(), tenant_id_var.get()
+
+
 class JSONFormatter(logging.Formatter):
     """Format logs as JSON for structured logging."""
 
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.utcfromtimestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -33,13 +49,14 @@ class JSONFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
-        # Add context variables
-        if request_id_var.get():
-            log_data["request_id"] = request_id_var.get()
-        if user_id_var.get():
-            log_data["user_id"] = user_id_var.get()
-        if tenant_id_var.get():
-            log_data["tenant_id"] = tenant_id_var.get()
+        # Add context variables (captured by the queue handler when queued)
+        request_id, user_id, tenant_id = getattr(record, 'log_context', None) or _read_context()
+        if request_id:
+            log_data["request_id"] = request_id
+        if user_id:
+            log_data["user_id"] = user_id
+        if tenant_id:
+            log_data["tenant_id"] = tenant_id
 
         # Add extra fields
         if hasattr(record, 'extra_data'):
@@ -49,39 +66,175 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
+        if HAS_ORJSON:
+            # orjson formats the naive UTC datetime natively with a Z suffix
+            return orjson.dumps(
+                log_data,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+            ).decode('utf-8')
+        log_data["timestamp"] = log_data["timestamp"].isoformat() + "Z"
         return json.dumps(log_data)
 
 
+# Handlers shared by every StructuredLogger so that creating a logger
+# (again) never duplicates output or reopens the log file
+_SHARED_FORMATTER = JSONFormatter()
+_SHARED_STDOUT = logging.StreamHandler(sys.stdout)
+_SHARED_STDOUT.setFormatter(_SHARED_FORMATTER)
+_FILE_HANDLERS: Dict[str, logging.FileHandler] = {}
+
+# Userspace buffer for the log file; bursts of records are written with
+# one write() once the queue drains
+_FILE_BUFFER_SIZE = 64 * 1024
+
+
+class _BatchingFileHandler(logging.FileHandler):
+    """FileHandler for the listener thread that coalesces writes.
+
+    Records are buffered and only flushed once the log queue is empty (or
+    on ERROR and above) instead of after every record.
+    """
+
+    def __init__(self, filename: str, log_queue: "queue.SimpleQueue", buffer_size: int = _FILE_BUFFER_SIZE):
+        self._log_queue = log_queue
+        self._buffer_size = buffer_size
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self._buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            msg = self.format(record)
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg + self.terminator)
+            if record.levelno >= logging.ERROR or self._log_queue.empty():
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _get_file_handler(path: str) -> logging.FileHandler:
+    """Get or create the shared file handler for path."""
+    handler = _FILE_HANDLERS.get(path)
+    if handler is None:
+        handler = _BatchingFileHandler(path, _LOG_QUEUE)
+        handler.setFormatter(_SHARED_FORMATTER)
+        _FILE_HANDLERS[path] = handler
+    return handler
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves JSON formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve the message and request context now, on the calling thread,
+        # but keep exc_info and extra_data so JSONFormatter sees them as usual
+        record.msg = record.getMessage()
+        record.args = None
+        record.log_context = _read_context()
+        return record
+
+
+# Callers only enqueue records; a background listener does the formatting
+# and the stdout/file writes off the request path
+_LOG_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_QUEUE_HANDLER = _DeferredQueueHandler(_LOG_QUEUE)
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def _ensure_listener():
+    """Start the queue listener (and open the log file) on first use."""
+    global _listener
+    if _listener is not None:
+        return
+    with _listener_lock:
+        if _listener is not None:
+            return
+        listener = logging.handlers.QueueListener(
+            _LOG_QUEUE,
+            _SHARED_STDOUT,
+            *([_get_file_handler(settings.logging.file_path)] if settings.logging.file_path else []),
+            respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(_stop_listener)
+        _listener = listener
+
+
+def _stop_listener():
+    """Stop the queue listener and flush buffered file output."""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            return
+        # The stop sentinel keeps the queue non-empty while the last records
+        # are written, so the batching file handlers may still hold them
+        _listener.stop()
+        _listener = None
+    for handler in _FILE_HANDLERS.values():
+        handler.flush()
+
+
+def _flush_before_fork():
+    """Flush buffered file output so a forked child can't write it again."""
+    for handler in _FILE_HANDLERS.values():
+        handler.flush()
+
+
+def _reinit_after_fork():
+    """Give a forked child its own queue and listener.
+
+    The parent's listener thread does not exist in the child, so records
+    logged there would otherwise sit in the inherited queue forever.
+    """
+    global _LOG_QUEUE, _listener, _listener_lock
+    had_listener = _listener is not None
+    _LOG_QUEUE = queue.SimpleQueue()
+    _QUEUE_HANDLER.queue = _LOG_QUEUE
+    for handler in _FILE_HANDLERS.values():
+        handler._log_queue = _LOG_QUEUE
+    _listener = None
+    _listener_lock = threading.Lock()
+    # Existing loggers won't call _ensure_listener again, so restart it here
+    if had_listener:
+        _ensure_listener()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_flush_before_fork, after_in_child=_reinit_after_fork)
+
+
 class StructuredLogger:
     """Logger with structured JSON output and context tracking."""
 
     def __init__(self, name: str, level: int = None):
+        _ensure_listener()
         self.logger = logging.getLogger(name)
         log_level = level or getattr(logging, settings.logging.level.upper())
         self.logger.setLevel(log_level)
 
-        # Remove existing handlers
-        self.logger.handlers = []
+        # Add the queue handler feeding the shared stdout/file handlers
+        if _QUEUE_HANDLER not in self.logger.handlers:
+            self.logger.addHandler(_QUEUE_HANDLER)
 
-        # Add JSON handler
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(JSONFormatter())
-        self.logger.addHandler(handler)
-
-        # Add file handler if configured
-        if settings.logging.file_path:
-            file_handler = logging.FileHandler(settings.logging.file_path)
-            file_handler.setFormatter(JSONFormatter())
-            self.logger.addHandler(file_handler)
+        # Records are fully handled here; don't repeat them via the root logger
+        self.logger.propagate = False
 
     def _log(self, level: int, message: str, **kwargs):
         """Log with extra data."""
-        record = self.logger.makeRecord(
-            self.logger.name, level, "", 0, message, (), None
+        # stacklevel=3 skips _log and the public wrapper (info, warning, ...)
+        # so module/function/line point at the caller
+        self.logger.log(
+            level, message,
+            extra={"extra_data": kwargs} if kwargs else None,
+            stacklevel=3
         )
-        if kwargs:
-            record.extra_data = kwargs
-        self.logger.handle(record)
 
     def debug(self, message: str, **kwargs):
         self._log(logging.DEBUG, message, **kwargs)
@@ -99,18 +252,26 @@ class StructuredLogger:
         self._log(logging.CRITICAL, message, **kwargs)
 
     def exception(self, message: str, **kwargs):
-        self.logger.exception(message, extra={'extra_data': kwargs})
-
+        # Log directly rather than via Logger.exception -> Logger.error, whose
+        # extra frames findCaller counts differently before Python 3.11
+        self.logger.log(
+            logging.ERROR, message,
+            exc_info=True,
+            extra={"extra_data": kwargs} if kwargs else None,
+            stacklevel=2
+        )
 
-# Global loggers for different components
-app_logger = StructuredLogger("nanonets.app")
-ocr_logger = StructuredLogger("nanonets.ocr")
-api_logger = StructuredLogger("nanonets.api")
-auth_logger = StructuredLogger("nanonets.auth")
-db_logger = StructuredLogger("nanonets.db")
 
-# Backwards compatibility
-logger = app_logger.logger
+# Global loggers for different components, created on first access
+# through the module __getattr__ below
+_COMPONENT_LOGGERS = {
+    "app_logger": "nanonets.app",
+    "ocr_logger": "nanonets.ocr",
+    "api_logger": "nanonets.api",
+    "auth_logger": "nanonets.auth",
+    "db_logger": "nanonets.db",
+}
+_LOGGERS: Dict[str, Any] = {}
 
 
 def setup_logger(name: str = "nanonets-vl", level: str = None) -> logging.Logger:
@@ -144,26 +305,26 @@ def clear_request_context():
 def log_execution_time(logger: StructuredLogger = None):
     """Decorator to log function execution time."""
     if logger is None:
-        logger = app_logger
+        logger = _get_logger("app_logger")
 
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start = time.time()
+            start = time.perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
-                elapsed_ms = int((time.time() - start) * 1000)
+                elapsed_ms = (time.perf_counter_ns() - start) // 1_000_000
                 logger.info(
-                    f"{func.__name__} completed",
+                    "function_completed",
                     function=func.__name__,
                     duration_ms=elapsed_ms,
                     status="success"
                 )
                 return result
             except Exception as e:
-                elapsed_ms = int((time.time() - start) * 1000)
+                elapsed_ms = (time.perf_counter_ns() - start) // 1_000_000
                 logger.error(
-                    f"{func.__name__} failed",
+                    "function_failed",
                     function=func.__name__,
                     duration_ms=elapsed_ms,
                     status="error",
@@ -184,7 +345,7 @@ class AuditLogger:
                   details: Dict[str, Any] = None, outcome: str = "success"):
         """Log an audit event."""
         self.logger.info(
-            f"Audit: {action}",
+            "audit_event",
             action=action,
             resource_type=resource_type,
             resource_id=resource_id,
@@ -226,7 +387,26 @@ class AuditLogger:
         )
 
 
-audit_logger = AuditLogger()
+def _get_logger(name: str):
+    """Get or create the named global logger."""
+    instance = _LOGGERS.get(name)
+    if instance is None:
+        if name == "audit_logger":
+            instance = AuditLogger()
+        else:
+            instance = StructuredLogger(_COMPONENT_LOGGERS[name])
+        instance = _LOGGERS.setdefault(name, instance)
+    return instance
+
+
+def __getattr__(name: str):
+    """Lazily create app_logger, ocr_logger, ..., audit_logger and logger."""
+    if name in _COMPONENT_LOGGERS or name == "audit_logger":
+        return _get_logger(name)
+    if name == "logger":
+        # Backwards compatibility
+        return _get_logger("app_logger").logger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
@@ -234,6 +414,11 @@ if __name__ == "__main__":
     print("LOGGER MODULE TEST")
     print("=" * 60)
 
+    app_logger = _get_logger("app_logger")
+    ocr_logger = _get_logger("ocr_logger")
+    api_logger = _get_logger("api_logger")
+    audit_logger = _get_logger("audit_logger")
+
     # Test structured logger
     set_request_context(
         request_id=generate_request_id(),
@@ -0,0 +1,26 @@
+"""
+JSON serialization helpers shared by the UIs, using orjson when available.
+"""
+import json
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps(obj) -> str:
+    """Serialize to indented JSON for display."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2)
+
+
+def dumps_bytes(obj) -> bytes:
+    """Serialize to compact JSON bytes (used for payload signatures)."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    # Match orjson's compact, non-ASCII-escaping output so signatures
+    # don't depend on whether orjson is installed
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
@@ -1,12 +1,41 @@
 """
 Environment validation and startup checks.
 """
+import importlib.util
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple
 
 from utils.logger import app_logger
 
+# (env var, description, message when unset)
+_OPTIONAL_ENV_VARS = (
+    ("DATABASE_URL", "PostgreSQL connection", "Using SQLite fallback"),
+    ("JWT_SECRET_KEY", "JWT signing key", "⚠️ Using default - insecure!"),
+    ("REDIS_URL", "Redis connection", "Caching disabled"),
+    ("S3_ENDPOINT_URL", "S3 storage", "Using local storage"),
+    ("SMTP_HOST", "Email notifications", "Email disabled"),
+    ("SLACK_WEBHOOK_URL", "Slack notifications", "Slack disabled"),
+)
+
+# (directory, description)
+_DIRS = (
+    ("logs", "Log files"),
+    ("uploads", "Uploaded documents"),
+    ("cache", "Model cache"),
+)
+
+# (module name, display name)
+_DEPENDENCIES = (
+    ("torch", "PyTorch"),
+    ("transformers", "HuggingFace Transformers"),
+    ("fastapi", "FastAPI"),
+    ("gradio", "Gradio"),
+    ("PIL", "Pillow"),
+    ("sqlalchemy", "SQLAlchemy"),
+)
+
 
 class StartupValidator:
     """Validates environment and dependencies on startup."""
@@ -16,16 +45,37 @@ class StartupValidator:
         self.warnings: List[str] = []
 
     def validate_all(self) -> bool:
-        """Run all validations."""
-        self._validate_python_version()
-        self._validate_required_env_vars()
-        self._validate_optional_env_vars()
-        self._validate_directories()
-        self._validate_dependencies()
-        self._validate_gpu()
+        """Run all validations.
+
+        The checks are independent, so they run concurrently and total time
+        is bounded by the slowest one (usually the GPU probe). Each check
+        collects into its own validator and results are merged in check
+        order, so the report is the same on every run.
+        """
+        checks = (
+            "_validate_python_version",
+            "_validate_required_env_vars",
+            "_validate_optional_env_vars",
+            "_validate_directories",
+            "_validate_dependencies",
+            "_validate_gpu",
+        )
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            # map() yields in input order and re-raises failures inside a check
+            results = list(executor.map(self._run_check, checks))
+
+        for errors, warnings in results:
+            self.errors.extend(errors)
+            self.warnings.extend(warnings)
 
         return len(self.errors) == 0
 
+    def _run_check(self, name: str) -> Tuple[List[str], List[str]]:
+        """Run one check on a fresh validator and return its (errors, warnings)."""
+        validator = type(self)()
+        getattr(validator, name)()
+        return validator.errors, validator.warnings
+
     def _validate_python_version(self):
         """Check Python version."""
         required = (3, 9)
@@ -43,50 +93,24 @@ class StartupValidator:
 
     def _validate_optional_env_vars(self):
         """Check optional but recommended environment variables."""
-        optional_vars = [
-            ("DATABASE_URL", "PostgreSQL connection", "Using SQLite fallback"),
-            ("JWT_SECRET_KEY", "JWT signing key", "⚠️ Using default - insecure!"),
-            ("REDIS_URL", "Redis connection", "Caching disabled"),
-            ("S3_ENDPOINT_URL", "S3 storage", "Using local storage"),
-            ("SMTP_HOST", "Email notifications", "Email disabled"),
-            ("SLACK_WEBHOOK_URL", "Slack notifications", "Slack disabled"),
-        ]
-
-        for var_name, description, warning_msg in optional_vars:
-            if not os.getenv(var_name):
+        for var_name, description, warning_msg in _OPTIONAL_ENV_VARS:
+            if not os.environ.get(var_name):
                 self.warnings.append(f"{var_name} not set - {warning_msg}")
 
     def _validate_directories(self):
-        """Ensure required directories exist."""
-        dirs = [
-            ("logs", "Log files"),
-            ("uploads", "Uploaded documents"),
-            ("cache", "Model cache"),
-        ]
-
-        for dir_name, description in dirs:
-            if not os.path.exists(dir_name):
-                try:
-                    os.makedirs(dir_name)
-                    app_logger.info(f"Created directory: {dir_name}")
-                except Exception as e:
-                    self.warnings.append(f"Could not create {dir_name}: {e}")
+        """Check required directories exist (see initialize_directories)."""
+        for dir_name, description in _DIRS:
+            if not os.path.isdir(dir_name):
+                self.warnings.append(
+                    f"Directory {dir_name} missing ({description}) - "
+                    "run: python -m utils.startup --init"
+                )
 
     def _validate_dependencies(self):
         """Check critical dependencies."""
-        dependencies = [
-            ("torch", "PyTorch"),
-            ("transformers", "HuggingFace Transformers"),
-            ("fastapi", "FastAPI"),
-            ("gradio", "Gradio"),
-            ("PIL", "Pillow"),
-            ("sqlalchemy", "SQLAlchemy"),
-        ]
-
-        for module_name, display_name in dependencies:
-            try:
-                __import__(module_name)
-            except ImportError:
+        for module_name, display_name in _DEPENDENCIES:
+            # find_spec checks availability without executing the module
+            if importlib.util.find_spec(module_name) is None:
                 self.errors.append(f"Missing dependency: {display_name} ({module_name})")
 
     def _validate_gpu(self):
@@ -133,6 +157,30 @@ class StartupValidator:
             return True
 
 
+def initialize_directories() -> bool:
+    """
+    Create the required directories (one-shot install/build step).
+
+    Returns:
+        True if every directory exists afterwards, False otherwise
+    """
+    ok = True
+    for dir_name, description in _DIRS:
+        # Attempt the mkdir directly instead of stat-then-mkdir; an
+        # existing path just raises FileExistsError
+        try:
+            os.makedirs(dir_name)
+            app_logger.info(f"Created directory: {dir_name}")
+        except FileExistsError:
+            if not os.path.isdir(dir_name):
+                app_logger.error(f"Could not create {dir_name}: path exists and is not a directory")
+                ok = False
+        except OSError as e:
+            app_logger.error(f"Could not create {dir_name}: {e}")
+            ok = False
+    return ok
+
+
 def validate_startup() -> bool:
     """
     Run startup validation.
@@ -155,4 +203,18 @@ def require_valid_startup():
 
 
 if __name__ == "__main__":
-    validate_startup()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Startup validation")
+    parser.add_argument(
+        "--init",
+        action="store_true",
+        help="Create required directories and exit"
+    )
+
+    args = parser.parse_args()
+
+    if args.init:
+        sys.exit(0 if initialize_directories() else 1)
+    else:
+        validate_startup()